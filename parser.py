@@ -1,12 +1,15 @@
 import re
-import fitz  # PyMuPDF
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import json
+import sys
+import warnings
 
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentMatch:
     """Stores information about a found assignment or date match."""
     text: str
@@ -14,6 +17,7 @@ class AssignmentMatch:
     context: str  # Surrounding text blurb
     match_type: str  # 'assignment' or 'date'
     position: tuple  # (x0, y0, x1, y1) bounding box coordinates
+    span: tuple = (0, 0)  # (start, end) character offsets within the page text
 
     def __str__(self):
         return f"""
@@ -26,13 +30,26 @@ class AssignmentMatch:
             """
 
 
+def _match_to_dict(m: AssignmentMatch) -> Dict:
+    """Field-for-field dict of an AssignmentMatch, without asdict's recursive deepcopy."""
+    return {
+        'text': m.text,
+        'page_number': m.page_number,
+        'context': m.context,
+        'match_type': m.match_type,
+        'position': m.position,
+        'span': m.span
+    }
+
+
 class PDFAssignmentParser:
     """
     A class that parses PDF documents to extract assignment information
     and dates using PyMuPDF.
     """
     
-    def __init__(self, context_window: int = 200, assignment_threshold: float = 0.5):
+    def __init__(self, context_window: int = 200, assignment_threshold: float = 0.5,
+                 max_workers: int = None):
         """
         Initialize the parser.
         
@@ -40,30 +57,33 @@ class PDFAssignmentParser:
             context_window: Number of characters to include before and after
                           a match when extracting context (default: 200)
             assignment_threshold: Confidence threshold for classifying real assignments (default: 0.5)
+            max_workers: If greater than 1, split a document's pages across this many
+                         worker processes (default: None, process pages in order in this process)
         """
         self.context_window = context_window
         self.assignment_threshold = assignment_threshold
+        self.max_workers = max_workers
+        # Date formats (lowercase, matched against lowercased page text)
         self.date_patterns = [
             # MM/DD/YYYY or MM-DD-YYYY
             r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-            # Month DD, YYYY or Month DD YYYY
-            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
-            # Mon DD, YYYY or Mon DD YYYY
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2},?\s+\d{4}\b',
+            # Month DD, YYYY or Mon DD, YYYY (with or without the comma or the
+            # abbreviation's period), one shared-prefix branch per month
+            r'\b(?:jan(?:uary|\.)?|feb(?:ruary|\.)?|mar(?:ch|\.)?|apr(?:il|\.)?|may\.?|jun(?:e|\.)?'
+            r'|jul(?:y|\.)?|aug(?:ust|\.)?|sep(?:tember|\.)?|oct(?:ober|\.)?|nov(?:ember|\.)?'
+            r'|dec(?:ember|\.)?)\s+\d{1,2},?\s+\d{4}\b',
             # DD Month YYYY
-            r'\b\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
+            r'\b\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b',
             # YYYY-MM-DD (ISO format)
             r'\b\d{4}-\d{2}-\d{2}\b',
             # Weekday, Month DD, YYYY
-            r'\b(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
+            r'\b(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday),?\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}\b',
         ]
         
         # Assignment keywords
         self.assignment_keywords = [
-            r'\bassignment\b',
-            r'\bassignments\b',
-            r'\bdue\s+date\b',
-            r'\bdue\b',
+            r'\bassignments?\b',
+            r'\bdue(?:\s+date)?\b',
             r'\bhomework\b',
             r'\bproject\b',
             r'\bexam\b',
@@ -74,55 +94,77 @@ class PDFAssignmentParser:
         ]
 
         self.combined_date_pattern = re.compile(
-                    '|'.join(f'({pattern})' for pattern in self.date_patterns),
-                    re.IGNORECASE
+                    '|'.join(f'({pattern})' for pattern in self.date_patterns)
                 )
         
+        # Matched against lowercased page text
         self.assignment_pattern = re.compile(
-            '|'.join(f'({keyword})' for keyword in self.assignment_keywords),
-            re.IGNORECASE
+            '|'.join(f'({keyword})' for keyword in self.assignment_keywords)
         )
         
+        # Literal words that an assignment or date match can start with, tagged by kind.
+        # Each page is swept once for these words and the full patterns above are only
+        # tried where one is found (dates may also start with a number).
+        self._keyword_tags = {
+            word: 'assignment'
+            for word in ['assignment', 'assignments', 'due', 'homework', 'project',
+                         'exam', 'final', 'midterm', 'quiz', 'lab']
+        }
+        for word in ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                     'august', 'september', 'october', 'november', 'december',
+                     'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']:
+            self._keyword_tags[word] = 'month'
+        for word in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']:
+            self._keyword_tags[word] = 'weekday'
+        self._word_pattern = re.compile(r'\w+')
+        
         # Positive indicators for real assignments
+        # (matched against lowercased page text, except capitalized_title)
         self.positive_patterns = {
             'assignment_number': re.compile(
-                r'\b(?:assignment|homework|hw|project|exam|quiz|lab)\s*[#:]?\s*\d+\b',
-                re.IGNORECASE
+                r'\b(?:assignment|homework|hw|project|exam|quiz|lab)\s*[#:]?\s*\d+\b'
             ),
             'action_verbs': re.compile(
-                r'\b(?:submit|complete|turn\s+in|hand\s+in|due|hand\s+out|assign)\b',
-                re.IGNORECASE
+                r'\b(?:submit|complete|turn\s+in|hand\s+in|due|hand\s+out|assign)\b'
             ),
             'point_values': re.compile(
-                r'\b(?:points?|pts?|worth|percent|%|grade)\b',
-                re.IGNORECASE
+                r'\b(?:points?|pts?|worth|percent|%|grade)\b'
             ),
+            # Only the shortest title a match needs is captured (in a lookahead, so titles
+            # that start inside another title's tail are still found)
             'capitalized_title': re.compile(
-                r'\b(?:Assignment|Homework|Project|Exam|Quiz|Lab)\s+[A-Z][A-Za-z\s]+',
+                r'\b(?=((?:Assignment|Homework|Project|Exam|Quiz|Lab)\s+[A-Z][A-Za-z\s]))',
                 re.IGNORECASE
             ),
-            'list_format': re.compile(
-                r'^[\s]*[•\-\*\d+\.]',  # Bullet points or numbered lists
-                re.MULTILINE
-            ),
         }
         
-        # Negative indicators (false positives)
+        # Leading characters of bullet points or numbered lists (besides digits)
+        self.list_markers = ('•', '-', '*', '+', '.')
+        
+        # Negative indicators (false positives, matched against lowercased page text)
         self.negative_patterns = {
             'assignment_of': re.compile(
-                r'\bassignment\s+of\s+(?:grades?|readings?|scores?|points?)\b',
-                re.IGNORECASE
+                r'\bassignment\s+of\s+(?:grades?|readings?|scores?|points?)\b'
             ),
             'reading_assignment': re.compile(
-                r'\breading\s+assignment\b',
-                re.IGNORECASE
+                r'\breading\s+assignment\b'
             ),
             'general_description': re.compile(
-                r'\bassignment\s+(?:schedule|calendar|list|overview|summary)\b',
-                re.IGNORECASE
+                r'\bassignment\s+(?:schedule|calendar|list|overview|summary)\b'
             ),
         }
         
+        # Every lowercase indicator in one alternation, so a page is scanned once and
+        # each hit is classified by its group name. Each group sits in a lookahead
+        # so a hit never consumes text that another indicator's hit overlaps; at most
+        # one indicator can match at a given offset and none overlaps itself, so the
+        # hits are the same as from a separate finditer per indicator
+        self._scoring_pattern = re.compile('|'.join(
+            f'(?=(?P<{name}>{pattern.pattern}))'
+            for name, pattern in {**self.positive_patterns, **self.negative_patterns}.items()
+            if name != 'capitalized_title'
+        ))
+        
         # Scoring weights
         self.scoring_weights = {
             'assignment_number': 0.3,
@@ -136,26 +178,82 @@ class PDFAssignmentParser:
             'reading_assignment': -0.5,
             'general_description': -0.3,
         }
+        
+        # Per-page (start offsets, end offsets) of every scoring pattern hit, keyed by page number
+        self._page_index = {}
+        # Confidence scores derived from self._page_index, keyed by (page number, span)
+        self._score_cache = {}
     
-    def _extract_pages(self, pdf_path: str) -> tuple:
+    def _iter_pages(self, pdf_path: str, first_page: int = 0, last_page: int = None):
         """
-        Extract all text from all pages of a PDF document.
+        Extract text from a PDF document one page at a time, along with the
+        location of every word in that text. Only the current page's text is
+        held in memory, and the document is closed once iteration ends.
         
         Args:
             pdf_path: Path to the PDF file
+            first_page: Index of the first page to extract (default: 0)
+            last_page: Index one past the last page to extract (default: None, the last page)
             
-        Returns:
-            Tuple of (document, list of page texts)
+        Yields:
+            Tuple of (page index, page text, lowercased page text, word index)
         """
+        import fitz  # PyMuPDF, deferred so importing this module stays cheap
+        
         doc = fitz.open(pdf_path)
-        page_texts = []
+        try:
+            if last_page is None:
+                last_page = len(doc)
+            for page_num in range(first_page, last_page):
+                page = doc[page_num]
+                textpage = page.get_textpage()
+                text = page.get_text(textpage=textpage)
+                word_index = self._index_words(text, page.get_text("words", textpage=textpage))
+                yield page_num, text, self._lower_text(text), word_index
+        finally:
+            doc.close()
+    
+    def _lower_text(self, text: str) -> str:
+        """
+        Lowercase text while keeping every character at the same offset.
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text()
-            page_texts.append(text)
+        Args:
+            text: Text to lowercase
+        
+        Returns:
+            Lowercased text with the same length as text
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters (e.g. 'İ') lowercase to more than one code point; keep those as-is
+            lowered = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+        return lowered
+    
+    def _index_words(self, text: str, words: List[tuple]) -> tuple:
+        """
+        Locate each extracted word within the page text.
+        
+        Args:
+            text: Full page text
+            words: Output of page.get_text("words") for the same page
         
-        return doc, page_texts
+        Returns:
+            Tuple of (word start offsets, word end offsets, word bounding boxes),
+            all in text order
+        """
+        starts, ends, boxes = [], [], []
+        cursor = 0
+        
+        for x0, y0, x1, y1, word, *_ in words:
+            start = text.find(word, cursor)
+            if start == -1:
+                continue
+            cursor = start + len(word)
+            starts.append(start)
+            ends.append(cursor)
+            boxes.append((x0, y0, x1, y1))
+        
+        return starts, ends, boxes
     
     def _extract_context(self, text: str, match_start: int, match_end: int) -> str:
         """
@@ -173,15 +271,179 @@ class PDFAssignmentParser:
         end_pos = min(len(text), match_end + self.context_window)
         return text[start_pos:end_pos].strip()
     
+    def _scan_page(self, text_lower: str) -> tuple:
+        """
+        Find assignment keyword and date matches in a page with a single word sweep.
+        
+        Equivalent to self.assignment_pattern.finditer(text_lower) and
+        self.combined_date_pattern.finditer(text_lower), but each pattern is only
+        tried at words that can start one of its matches: assignment keywords for
+        the former, month or weekday names and numbers for the latter.
+        
+        Args:
+            text_lower: Lowercased page text to scan
+        
+        Returns:
+            Tuple of (assignment re.Match list, date re.Match list), each in order
+        """
+        assignment_hits = []
+        date_hits = []
+        assignment_end = 0
+        date_end = 0
+        
+        for word in self._word_pattern.finditer(text_lower):
+            start = word.start()
+            token = word.group()
+            tag = self._keyword_tags.get(token)
+            
+            if tag == 'assignment':
+                if start >= assignment_end:
+                    match = self.assignment_pattern.match(text_lower, start)
+                    if match:
+                        assignment_hits.append(match)
+                        assignment_end = match.end()
+            elif (tag is not None or token[0].isdigit()) and start >= date_end:
+                match = self.combined_date_pattern.match(text_lower, start)
+                if match:
+                    date_hits.append(match)
+                    date_end = match.end()
+        
+        return assignment_hits, date_hits
+    
+    def _index_text(self, text: str, text_lower: str, date_spans: List[tuple]) -> Dict[str, tuple]:
+        """
+        Run every scoring pattern once over a text and record the sorted start
+        and end offsets of its hits, so scoring a match is a window lookup
+        instead of a regex sweep over its context.
+        
+        Args:
+            text: Text to index
+            text_lower: Lowercased text (see _lower_text)
+            date_spans: (start, end) offsets of the dates in text, in order
+        
+        Returns:
+            Dictionary mapping each indicator to (start offsets, end offsets),
+            plus the line start offsets, whether each line is a list item and the
+            lines longer than the context window
+        """
+        index = {name: ([], []) for name in self._scoring_pattern.groupindex}
+        for match in self._scoring_pattern.finditer(text_lower):
+            name = match.lastgroup
+            starts, ends = index[name]
+            starts.append(match.start(name))
+            ends.append(match.end(name))
+        index['dates'] = ([start for start, _ in date_spans], [end for _, end in date_spans])
+        # capitalized_title needs the original case; a hit ends where the shortest
+        # title it captures ends
+        title_hits = list(self.positive_patterns['capitalized_title'].finditer(text))
+        index['capitalized_title'] = ([m.start() for m in title_hits], [m.end(1) for m in title_hits])
+        
+        # Line start offsets, and whether each line is a list item
+        index['line_starts'] = []
+        index['list_lines'] = []
+        # Only a line this long can start before a match's context window
+        index['long_lines'] = {}
+        line_start = 0
+        for line in text.split('\n'):
+            stripped = line.lstrip()
+            if len(line) > self.context_window:
+                index['long_lines'][len(index['line_starts'])] = line
+            index['line_starts'].append(line_start)
+            index['list_lines'].append(stripped[:1] in self.list_markers or stripped[:1].isdigit())
+            line_start += len(line) + 1
+        return index
+    
+    def _build_page_index(self, page_num: int, text: str, text_lower: str,
+                          assignment_matches: List[AssignmentMatch],
+                          date_matches: List[AssignmentMatch]) -> None:
+        """
+        Index the scoring pattern hits of a page (see _index_text).
+        
+        Args:
+            page_num: Page index (0-indexed)
+            text: Full page text
+            text_lower: Lowercased page text
+            assignment_matches: Assignment matches found on this page
+            date_matches: Date matches found on this page
+        """
+        index = self._index_text(text, text_lower, [date_match.span for date_match in date_matches])
+        # The matches this index can score, to tell them apart from matches of other documents
+        index['assignments'] = {match.span: match.text for match in assignment_matches}
+        self._page_index[page_num + 1] = index
+    
+    def _count_in_window(self, hits: tuple, match: AssignmentMatch) -> int:
+        """
+        Count the hits that lie entirely within the context window of a match,
+        i.e. the hits a search over match.context would find.
+        
+        Args:
+            hits: Tuple of (sorted start offsets, sorted end offsets) on the match's page
+            match: AssignmentMatch whose span defines the window
+        
+        Returns:
+            Number of hits with start >= start - context_window and
+            end <= end + context_window
+        """
+        starts, ends = hits
+        match_start, match_end = match.span
+        lo = bisect_left(starts, match_start - self.context_window)
+        hi = bisect_right(ends, match_end + self.context_window)
+        return max(0, hi - lo)
+    
+    def _on_list_line(self, match: AssignmentMatch, page_index: Dict[str, tuple], in_context: bool) -> bool:
+        """
+        Check whether the line containing a match is a list item, judged on
+        the part of the line that lies within the match's context.
+        
+        Args:
+            match: AssignmentMatch to check
+            page_index: Index of the match's page, or of match.context if in_context
+            in_context: Whether page_index is the index of match.context
+        
+        Returns:
+            True if the visible part of the match's line starts with a list marker or digit
+        """
+        line_starts = page_index.get('line_starts')
+        if not line_starts:
+            return False
+        match_start = match.span[0]
+        
+        if in_context:
+            # The context starts at most context_window characters before the match (less
+            # the whitespace stripped from its start), so take the last occurrence by then
+            context = match.context
+            if match.span == (0, 0):
+                offset = context.find(match.text)
+            else:
+                offset = context.rfind(match.text, 0, min(match_start, self.context_window) + len(match.text))
+            if offset == -1:
+                return False
+            return page_index['list_lines'][bisect_right(line_starts, offset) - 1]
+        
+        line = bisect_right(line_starts, match_start) - 1
+        window_start = match_start - self.context_window
+        if line_starts[line] >= window_start:
+            return page_index['list_lines'][line]
+        # The line starts before the context, which only shows its tail
+        stripped = page_index['long_lines'][line][window_start - line_starts[line]:].lstrip()
+        return stripped[:1] in self.list_markers or stripped[:1].isdigit()
+    
     # MARK: do we even need this function
-    def _is_real_assignment(self, match: AssignmentMatch, date_matches: List[AssignmentMatch] = None, threshold: float = None) -> tuple[bool, float]:
+    def _is_real_assignment(self, match: AssignmentMatch, date_matches: List[AssignmentMatch] = None, threshold: float = None,
+                            *, page_index: Dict[str, tuple] = None) -> tuple[bool, float]:
         """
         Determine if an assignment match is a real assignment task.
         
+        Matches from the last processed document are scored from its page index;
+        any other match (e.g. built by hand) is scored by searching its own context.
+        
         Args:
             match: AssignmentMatch object to classify
             date_matches: Optional list of date matches to check for proximity
+                          (dates near the match are found from the page index or context if None)
             threshold: Optional threshold override (uses self.assignment_threshold if None)
+            page_index: Optional pattern offsets for the match's page
+                        (looked up from self._page_index if None)
         
         Returns:
             Tuple of (is_real: bool, confidence_score: float)
@@ -189,42 +451,63 @@ class PDFAssignmentParser:
         if threshold is None:
             threshold = self.assignment_threshold
         
-        context = match.context.lower()
+        # Scores computed from self._page_index are cached per match; the threshold is applied on top
+        cache_key = None
+        in_context = False
+        if page_index is None:
+            page_index = self._page_index.get(match.page_number)
+            if page_index is None or page_index['assignments'].get(match.span) != match.text:
+                # Not found in the last processed document, so search the match's own context
+                context_lower = self._lower_text(match.context)
+                date_spans = [date_match.span() for date_match in self._scan_page(context_lower)[1]]
+                page_index = self._index_text(match.context, context_lower, date_spans)
+                in_context = True
+            elif not date_matches:
+                cache_key = (match.page_number, match.span)
+                if cache_key in self._score_cache:
+                    normalized_score = self._score_cache[cache_key]
+                    return (normalized_score >= threshold, normalized_score)
+        
+        def hits(name):
+            found = page_index.get(name, ([], []))
+            if in_context:
+                return len(found[0])
+            return self._count_in_window(found, match)
+        
         score = 0.0
         
         # Check for positive indicators
         # 1. Assignment numbering
-        if self.positive_patterns['assignment_number'].search(context):
+        if hits('assignment_number'):
             score += self.scoring_weights['assignment_number']
         
         # 2. Due date proximity (check if date is within context)
         if date_matches:
-            for date_match in date_matches:
-                if date_match.page_number == match.page_number:
-                    # Check if date appears in the context
-                    if date_match.text.lower() in context:
-                        score += self.scoring_weights['due_date_proximity']
-                        break
+            context = match.context.lower()
+            near_date = any(
+                date_match.page_number == match.page_number and date_match.text.lower() in context
+                for date_match in date_matches
+            )
         else:
-            # Fallback: check if any date pattern appears in context
-            if self.combined_date_pattern.search(context):
-                score += self.scoring_weights['due_date_proximity']
+            near_date = hits('dates')
+        if near_date:
+            score += self.scoring_weights['due_date_proximity']
         
         # 3. Action verbs (count matches, cap at max)
-        action_verb_matches = len(self.positive_patterns['action_verbs'].findall(context))
+        action_verb_matches = hits('action_verbs')
         action_verb_score = min(action_verb_matches * self.scoring_weights['action_verbs'], 0.4)
         score += action_verb_score
         
         # 4. Point values
-        if self.positive_patterns['point_values'].search(context):
+        if hits('point_values'):
             score += self.scoring_weights['point_values']
         
         # 5. Capitalized title
-        if self.positive_patterns['capitalized_title'].search(match.context):  # Use original case
+        if hits('capitalized_title'):
             score += self.scoring_weights['capitalized_title']
         
-        # 6. List format
-        if self.positive_patterns['list_format'].search(match.context):
+        # 6. List format (the line containing the match is a list item)
+        if self._on_list_line(match, page_index, in_context):
             score += self.scoring_weights['list_format']
         
         # 7. Specific keywords (already matched, but add bonus)
@@ -233,15 +516,15 @@ class PDFAssignmentParser:
         
         # Check for negative indicators
         # 1. "assignment of"
-        if self.negative_patterns['assignment_of'].search(context):
+        if hits('assignment_of'):
             score += self.scoring_weights['assignment_of']
         
         # 2. "reading assignment"
-        if self.negative_patterns['reading_assignment'].search(context):
+        if hits('reading_assignment'):
             score += self.scoring_weights['reading_assignment']
         
         # 3. General descriptions
-        if self.negative_patterns['general_description'].search(context):
+        if hits('general_description'):
             score += self.scoring_weights['general_description']
         
         # Normalize score to 0.0-1.0 range
@@ -254,146 +537,143 @@ class PDFAssignmentParser:
         
         # Normalize: shift to start at 0, then scale to 0-1
         normalized_score = max(0.0, min(1.0, (score - min_possible_score) / score_range))
+        if cache_key is not None:
+            self._score_cache[cache_key] = normalized_score
         
         is_real = normalized_score >= threshold
         return (is_real, normalized_score)
     
-    def _get_bounding_box(self, doc, page_num: int, match_text: str) -> tuple:
+    def _get_bounding_box(self, word_index: tuple, match_start: int, match_end: int) -> tuple:
         """
         Get bounding box coordinates for a text match.
         
         Args:
-            doc: PyMuPDF document object
-            page_num: Page number (0-indexed)
-            match_text: Text to find bounding box for
+            word_index: Word index of the match's page (see _index_words)
+            match_start: Start position of the match in the page text
+            match_end: End position of the match in the page text
             
         Returns:
-            Tuple of (x0, y0, x1, y1) coordinates, or (0, 0, 0, 0) if not found
+            Tuple of (x0, y0, x1, y1) coordinates covering every word the match
+            touches, or (0, 0, 0, 0) if not found
         """
-        try:
-            page = doc[page_num]
-            text_instances = page.search_for(match_text)
-            if text_instances:
-                rect = text_instances[0]
-                # Convert Rect object to tuple
-                return tuple(rect)  # Rect objects can be converted to tuple/list
-            return (0, 0, 0, 0)
-        except:
+        starts, ends, boxes = word_index
+        first = bisect_right(ends, match_start)
+        last = bisect_left(starts, match_end)
+        if first >= last:
             return (0, 0, 0, 0)
-    
-    def _find_assignments(self, doc, page_texts: List[str]) -> List[AssignmentMatch]:
-        """
-        Find assignment keywords and extract context.
-        
-        Args:
-            doc: PyMuPDF document object
-            page_texts: List of text content for each page
-            
-        Returns:
-            List of AssignmentMatch objects for found assignments
-        """
-        assignment_matches = []
-        
-        for page_num, text in enumerate(page_texts):
-            for match in self.assignment_pattern.finditer(text):
-                context = self._extract_context(text, match.start(), match.end())
-                bbox = self._get_bounding_box(doc, page_num, match.group())
-                
-                assignment_match = AssignmentMatch(
-                    text=match.group(),
-                    page_number=page_num + 1,
-                    context=context,
-                    match_type='assignment',
-                    position=bbox
-                )
-                assignment_matches.append(assignment_match)
         
-        return assignment_matches
+        spanned = boxes[first:last]
+        return (
+            min(box[0] for box in spanned),
+            min(box[1] for box in spanned),
+            max(box[2] for box in spanned),
+            max(box[3] for box in spanned),
+        )
     
-    def _find_dates(self, doc, page_texts: List[str]) -> List[AssignmentMatch]:
+    def _find_assignments_and_dates(self, page_num: int, text: str, text_lower: str,
+                                    word_index: tuple) -> tuple:
         """
-        Find dates and extract context.
+        Find assignment keywords and dates on a page and extract context.
         
         Args:
-            doc: PyMuPDF document object
-            page_texts: List of text content for each page
+            page_num: Page index (0-indexed)
+            text: Full page text
+            text_lower: Lowercased page text
+            word_index: Word index of the page (see _index_words)
             
         Returns:
-            List of AssignmentMatch objects for found dates
+            Tuple of (AssignmentMatch list for found assignments,
+            AssignmentMatch list for found dates)
         """
+        assignment_matches = []
         date_matches = []
+        assignment_hits, date_hits = self._scan_page(text_lower)
         
-        for page_num, text in enumerate(page_texts):
-            for match in self.combined_date_pattern.finditer(text):
+        for match_type, hits, found in (('assignment', assignment_hits, assignment_matches),
+                                        ('date', date_hits, date_matches)):
+            for match in hits:
                 context = self._extract_context(text, match.start(), match.end())
-                bbox = self._get_bounding_box(doc, page_num, match.group())
+                bbox = self._get_bounding_box(word_index, match.start(), match.end())
                 
-                date_match = AssignmentMatch(
-                    text=match.group(),
+                found.append(AssignmentMatch(
+                    text=text[match.start():match.end()],
                     page_number=page_num + 1,
                     context=context,
-                    match_type='date',
-                    position=bbox
-                )
-                date_matches.append(date_match)
+                    match_type=match_type,
+                    position=bbox,
+                    span=match.span()
+                ))
         
-        return date_matches
+        return assignment_matches, date_matches
     
-    def _find_combined_matches(self, page_texts: List[str], 
+    def _find_combined_matches(self, page_num: int, text: str,
                                assignment_matches: List[AssignmentMatch],
                                date_matches: List[AssignmentMatch]) -> List[AssignmentMatch]:
         """
-        Find combined matches where assignments and dates appear nearby.
+        Find combined matches where assignments and dates appear nearby on a page.
         
         Args:
-            page_texts: List of text content for each page
-            assignment_matches: List of found assignment matches
-            date_matches: List of found date matches
+            page_num: Page index (0-indexed)
+            text: Full page text
+            assignment_matches: Assignment matches found on this page, in offset order
+            date_matches: Date matches found on this page, in offset order
             
         Returns:
             List of AssignmentMatch objects for combined matches
         """
         combined_matches = []
-        
-        for page_num, text in enumerate(page_texts):
-            # Get regex matches for this page
-            assignment_regex_matches = list(self.assignment_pattern.finditer(text))
-            date_regex_matches = list(self.combined_date_pattern.finditer(text))
+        date_idx = 0
+        
+        # Check if any assignment and date are within 300 characters of each other.
+        # Assignments are visited in offset order, so the first date in range only moves forward
+        for assn_match in assignment_matches:
+            assn_start, assn_end = assn_match.span
+            while date_idx < len(date_matches) and date_matches[date_idx].span[0] <= assn_start - 300:
+                date_idx += 1
+            if date_idx == len(date_matches) or date_matches[date_idx].span[0] >= assn_start + 300:
+                continue
+            
+            # Get combined context
+            date_match = date_matches[date_idx]
+            date_start, date_end = date_match.span
+            start_pos = min(assn_start, date_start)
+            end_pos = max(assn_end, date_end)
+            context = self._extract_context(text, start_pos, end_pos)
             
-            # Check if any assignment and date are within 300 characters of each other
-            for assn_match in assignment_regex_matches:
-                for date_match in date_regex_matches:
-                    distance = abs(assn_match.start() - date_match.start())
-                    if distance < 300:  # Within 300 characters
-                        # Get combined context
-                        start_pos = min(assn_match.start(), date_match.start())
-                        end_pos = max(assn_match.end(), date_match.end())
-                        context = self._extract_context(text, start_pos, end_pos)
-                        
-                        combined_match = AssignmentMatch(
-                            text=f"{assn_match.group()} | {date_match.group()}",
-                            page_number=page_num + 1,
-                            context=context,
-                            match_type='combined',
-                            position=(0, 0, 0, 0)
-                        )
-                        combined_matches.append(combined_match)
-                        break  # Only add once per assignment match
+            combined_match = AssignmentMatch(
+                text=f"{assn_match.text} | {date_match.text}",
+                page_number=page_num + 1,
+                context=context,
+                match_type='combined',
+                position=(0, 0, 0, 0),
+                span=(start_pos, end_pos)
+            )
+            combined_matches.append(combined_match)
         
         return combined_matches
     
-    def filter_real_assignments(self, assignment_matches: List[AssignmentMatch], 
+    def filter_real_assignments(self, assignment_matches: List[AssignmentMatch],
                                 date_matches: List[AssignmentMatch] = None) -> List[AssignmentMatch]:
         """
         Filter assignment matches to only include real assignments.
         
         Args:
             assignment_matches: List of AssignmentMatch objects to filter
-            date_matches: Optional list of date matches for proximity checking
+            date_matches: Deprecated, dates near each match are found from the page index.
+                          If given, a match is near a date when one of these dates
+                          appears in its context, as before
             
         Returns:
             List of AssignmentMatch objects that are classified as real assignments
         """
+        if date_matches is not None:
+            warnings.warn(
+                "filter_real_assignments: date_matches is deprecated, dates near each "
+                "match are found from the page index",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        
         real_assignments = []
         for match in assignment_matches:
             is_real, confidence = self._is_real_assignment(match, date_matches)
@@ -401,6 +681,97 @@ class PDFAssignmentParser:
                 real_assignments.append(match)
         return real_assignments
     
+    def _process_page(self, page_num: int, text: str, text_lower: str, word_index: tuple,
+                      filter_real: bool = False) -> tuple:
+        """
+        Find, index and pair up the matches on a single page.
+        
+        Args:
+            page_num: Page index (0-indexed)
+            text: Full page text
+            text_lower: Lowercased page text
+            word_index: Word index of the page (see _index_words)
+            filter_real: If True, filter assignments to only include real assignments (default: False)
+        
+        Returns:
+            Tuple of (assignment matches, date matches, combined matches) for the page
+        """
+        page_assignments, page_dates = self._find_assignments_and_dates(page_num, text, text_lower, word_index)
+        self._build_page_index(page_num, text, text_lower, page_assignments, page_dates)
+        
+        # Filter assignments if requested
+        if filter_real:
+            page_assignments = self.filter_real_assignments(page_assignments)
+        
+        page_combined = self._find_combined_matches(page_num, text, page_assignments, page_dates)
+        return page_assignments, page_dates, page_combined
+    
+    def _process_document(self, pdf_path: str, filter_real: bool = False) -> tuple:
+        """
+        Process every page of a PDF document, in worker processes if self.max_workers > 1.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            filter_real: If True, filter assignments to only include real assignments (default: False)
+        
+        Returns:
+            Tuple of (assignment matches, date matches, combined matches) in page order
+        """
+        self._page_index = {}
+        self._score_cache = {}
+        
+        if self.max_workers and self.max_workers > 1:
+            page_results = self._process_pages_in_parallel(pdf_path, filter_real)
+        else:
+            page_results = (
+                self._process_page(*page, filter_real=filter_real) for page in self._iter_pages(pdf_path)
+            )
+        
+        assignment_matches = []
+        date_matches = []
+        combined_matches = []
+        for page_assignments, page_dates, page_combined in page_results:
+            assignment_matches.extend(page_assignments)
+            date_matches.extend(page_dates)
+            combined_matches.extend(page_combined)
+        
+        return assignment_matches, date_matches, combined_matches
+    
+    def _process_pages_in_parallel(self, pdf_path: str, filter_real: bool) -> List[tuple]:
+        """
+        Split a document into contiguous page ranges and process each range in a
+        worker process. Each worker opens the PDF itself, since PyMuPDF documents
+        cannot be passed between processes.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            filter_real: If True, filter assignments to only include real assignments
+        
+        Returns:
+            List of per-page (assignment matches, date matches, combined matches) in page order
+        """
+        import fitz  # PyMuPDF
+        
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+        pages_per_worker = max(1, -(-page_count // self.max_workers))
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(_process_page_range, self, pdf_path, first_page,
+                                min(first_page + pages_per_worker, page_count), filter_real)
+                for first_page in range(0, page_count, pages_per_worker)
+            ]
+            range_results = [future.result() for future in futures]
+        
+        # Keep the workers' page indexes and scores so later scoring calls reuse them
+        page_results = []
+        for results, page_index, score_cache in range_results:
+            page_results.extend(results)
+            self._page_index.update(page_index)
+            self._score_cache.update(score_cache)
+        return page_results
+    
     def extract_assignments_and_dates(self, pdf_path: str, filter_real: bool = False) -> Dict[str, List[AssignmentMatch]]:
         """
         Extract assignments and dates from a PDF document.
@@ -415,18 +786,7 @@ class PDFAssignmentParser:
             - 'dates': List of AssignmentMatch objects where dates were found
             - 'combined': List of AssignmentMatch objects where both assignment and date appear nearby
         """
-        doc, page_texts = self._extract_pages(pdf_path)
-        
-        assignment_matches = self._find_assignments(doc, page_texts)
-        date_matches = self._find_dates(doc, page_texts)
-        
-        # Filter assignments if requested
-        if filter_real:
-            assignment_matches = self.filter_real_assignments(assignment_matches, date_matches)
-        
-        combined_matches = self._find_combined_matches(page_texts, assignment_matches, date_matches)
-        
-        doc.close()
+        assignment_matches, date_matches, combined_matches = self._process_document(pdf_path, filter_real)
         
         return {
             'assignments': assignment_matches,
@@ -444,14 +804,11 @@ class PDFAssignmentParser:
         Returns:
             List of dictionaries with assignment info and confidence scores
         """
-        doc, page_texts = self._extract_pages(pdf_path)
-        assignment_matches = self._find_assignments(doc, page_texts)
-        date_matches = self._find_dates(doc, page_texts)
-        doc.close()
+        assignment_matches, _, _ = self._process_document(pdf_path)
         
         assignments_with_confidence = []
         for match in assignment_matches:
-            is_real, confidence = self._is_real_assignment(match, date_matches)
+            is_real, confidence = self._is_real_assignment(match)
             assignments_with_confidence.append({
                 'text': match.text,
                 'page': match.page_number,
@@ -463,7 +820,7 @@ class PDFAssignmentParser:
         
         return assignments_with_confidence
     
-    def get_structured_data(self, pdf_path: str, filter_real: bool = False) -> Dict:
+    def get_structured_data(self, pdf_path: str, filter_real: bool = False, debug: bool = False) -> Dict:
         """
         Get structured data in a format easier to process.
         
@@ -475,31 +832,20 @@ class PDFAssignmentParser:
         Args:
             pdf_path: Path to the PDF file
             filter_real: If True, filter assignments to only include real assignments (default: False)
+            debug: If True, print every match as JSON to stdout (default: False)
         """
         matches = self.extract_assignments_and_dates(pdf_path, filter_real=filter_real)
         
         # Calculate confidence and classification for all assignments
         # Use a helper function to get classification for a match
         def get_classification(assn_match):
-            is_real, confidence = self._is_real_assignment(assn_match, matches['dates'])
+            is_real, confidence = self._is_real_assignment(assn_match)
             return {
                 'is_real': is_real,
                 'confidence': confidence,
                 'confidence_percentage': confidence * 100
             }
         
-        matches_dict = {
-            'assignments': [
-                {
-                    **asdict(m),
-                    **get_classification(m)
-                }
-                for m in matches['assignments']
-            ],
-            'dates': [asdict(m) for m in matches['dates']],
-            'combined': [asdict(m) for m in matches['combined']]
-        }
-
         # Organize by page (with confidence and classification)
         by_page = {}
         for match_type, match_list in matches.items():
@@ -525,13 +871,19 @@ class PDFAssignmentParser:
         
         # Create potential assignments list (combining assignments with nearby dates, confidence, and classification)
         potential_assignments = []
+        
+        # First assignment match for each (text, page), and date matches grouped by page
+        assn_index = {}
+        for assn in matches['assignments']:
+            assn_index.setdefault((assn.text, assn.page_number), assn)
+        dates_by_page = {}
+        for date in matches['dates']:
+            dates_by_page.setdefault(date.page_number, []).append(date)
+        
         for combined in matches['combined']:
             # Find the assignment match that corresponds to this combined match
             assn_text = combined.text.split(' | ')[0] if ' | ' in combined.text else combined.text
-            corresponding_assn = next(
-                (a for a in matches['assignments'] if a.text == assn_text and a.page_number == combined.page_number),
-                None
-            )
+            corresponding_assn = assn_index.get((assn_text, combined.page_number))
             
             assignment_data = {
                 'page': combined.page_number,
@@ -551,9 +903,8 @@ class PDFAssignmentParser:
         for assn in matches['assignments']:
             # Check if there's a date on the same page within context
             nearby_dates = [
-                d for d in matches['dates']
-                if d.page_number == assn.page_number
-                and (d.context in assn.context or assn.context in d.context)
+                d for d in dates_by_page.get(assn.page_number, [])
+                if d.context in assn.context or assn.context in d.context
             ]
             if nearby_dates:
                 classification = get_classification(assn)
@@ -575,16 +926,52 @@ class PDFAssignmentParser:
             'potential_assignments': potential_assignments
         }
 
-        print(json.dumps(matches_dict, indent=4))
+        if debug:
+            matches_dict = {
+                'assignments': [
+                    {
+                        **_match_to_dict(m),
+                        **get_classification(m)
+                    }
+                    for m in matches['assignments']
+                ],
+                'dates': [_match_to_dict(m) for m in matches['dates']],
+                'combined': [_match_to_dict(m) for m in matches['combined']]
+            }
+            json.dump(matches_dict, sys.stdout, indent=4)
+            print()
         return structured_data
 
 
-print("Starting parser...")
-try:
-    parser = PDFAssignmentParser(assignment_threshold=0.6)
-    parser.get_structured_data("AR 202 syllabus 2026.doc.pdf")
-    print("Parser completed")
-except Exception as e:
-    print(f"Error occurred: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+def _process_page_range(parser: PDFAssignmentParser, pdf_path: str, first_page: int,
+                        last_page: int, filter_real: bool) -> tuple:
+    """
+    Worker process entry point for PDFAssignmentParser._process_pages_in_parallel.
+    
+    Args:
+        parser: Parser whose settings and patterns to use
+        pdf_path: Path to the PDF file
+        first_page: Index of the first page to process
+        last_page: Index one past the last page to process
+        filter_real: If True, filter assignments to only include real assignments
+    
+    Returns:
+        Tuple of (per-page results, page index, score cache) for the range
+    """
+    results = [
+        parser._process_page(*page, filter_real=filter_real)
+        for page in parser._iter_pages(pdf_path, first_page, last_page)
+    ]
+    return results, parser._page_index, parser._score_cache
+
+
+if __name__ == "__main__":
+    print("Starting parser...")
+    try:
+        parser = PDFAssignmentParser(assignment_threshold=0.6)
+        parser.get_structured_data("AR 202 syllabus 2026.doc.pdf", debug=True)
+        print("Parser completed")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+        import traceback
+        traceback.print_exc()
\ No newline at end of file
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+import fitz  # PyMuPDF
+
+from parser import PDFAssignmentParser
+
+
+SYLLABUS_PDF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "AR 202 syllabus 2026.doc.pdf")
+
+OTHER_PDF_LINES = [
+    "- Homework #3 submit by 02/14/2026",
+    "1. Project Proposal due 2026-03-01 (20% of grade)",
+    "The assignment of grades follows the policy.",
+    "See the assignment schedule for details.",
+    "Final Exam: Friday, May 8, 2026",
+]
+
+
+class CrossDocumentScoringTest(unittest.TestCase):
+    """Scores of a document's matches must not depend on which PDF was parsed last."""
+
+    def setUp(self):
+        self.parser = PDFAssignmentParser()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.other_pdf = os.path.join(self.tmp_dir.name, "other.pdf")
+        doc = fitz.open()
+        for _ in range(2):
+            page = doc.new_page()
+            for i, line in enumerate(OTHER_PDF_LINES * 4):
+                page.insert_text((40, 40 + 16 * i), line, fontsize=9)
+        doc.save(self.other_pdf)
+        doc.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assert_scores_unchanged(self, first_pdf, second_pdf):
+        assignments = self.parser.extract_assignments_and_dates(first_pdf)['assignments']
+        self.assertTrue(assignments)
+        before = [self.parser._is_real_assignment(match) for match in assignments]
+
+        self.parser.extract_assignments_and_dates(second_pdf)
+        after = [self.parser._is_real_assignment(match) for match in assignments]
+
+        self.assertEqual(before, after)
+
+    def test_syllabus_scores_after_parsing_another_pdf(self):
+        self.assert_scores_unchanged(SYLLABUS_PDF, self.other_pdf)
+
+    def test_other_scores_after_parsing_the_syllabus(self):
+        self.assert_scores_unchanged(self.other_pdf, SYLLABUS_PDF)
+
+
+if __name__ == "__main__":
+    unittest.main()